@@ -41,6 +41,24 @@ class MarkdownMemoryContractsTests(unittest.TestCase):
         self.assertNotIn("CareerCorpus/corpus.md", text)
         self.assertNotIn("CareerCorpus/metadata.md", text)
 
+    def test_memory_persistence_guide_reuses_confirmed_repo(self) -> None:
+        text = (self.repo_root / "knowledge_files/MemoryPersistenceGuidelines.md").read_text(
+            encoding="utf-8"
+        )
+        self.assertIn(
+            "Skip when `memory_repo_exists` is already confirmed this session; "
+            "reuse the branch from the last successful `getBranchRef`.",
+            text,
+        )
+        self.assertIn("If `getBranchRef` on the reused branch fails, redo step 2 once", text)
+
+    def test_memory_persistence_guide_skips_post_push_reread(self) -> None:
+        text = (self.repo_root / "knowledge_files/MemoryPersistenceGuidelines.md").read_text(
+            encoding="utf-8"
+        )
+        self.assertIn("Take new section blob SHAs from the step 6 `createGitBlob` responses.", text)
+        self.assertIn("Do not re-read `getGitCommit`/`getGitTree` just to confirm the push.", text)
+
     def test_onboarding_uses_section_files(self) -> None:
         text = (self.repo_root / "knowledge_files/OnboardingGuidelines.md").read_text(
             encoding="utf-8"